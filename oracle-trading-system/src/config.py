@@ -9,29 +9,32 @@ Handles all configuration with:
 """
 
 import os
-import json
 import base64
-from dataclasses import dataclass, field
+from collections import namedtuple
+from dataclasses import dataclass, field, fields
 from typing import List, Optional
 from pathlib import Path
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeConfig:
     """Exchange API configuration"""
     name: str
     api_key: str
     api_secret: str
     base_url: str
+    ws_url: str = "wss://socket.india.delta.exchange"
     testnet: bool = False
     rate_limit: int = 10  # requests per second
     timeout: int = 30
 
 
-@dataclass  
+@dataclass(slots=True)
 class StrategyConfig:
     """Trading strategy parameters"""
     name: str = "RSI Momentum"
@@ -47,7 +50,7 @@ class StrategyConfig:
     sma_slow: int = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskConfig:
     """Risk management settings"""
     max_daily_loss: float = 0.10  # 10% max daily loss
@@ -56,7 +59,7 @@ class RiskConfig:
     cool_down_after_loss: int = 300  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertConfig:
     """Alerting configuration"""
     telegram_enabled: bool = False
@@ -69,23 +72,25 @@ class AlertConfig:
     email_to: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoringConfig:
     """Monitoring and metrics configuration"""
     prometheus_port: int = 8080
+    prometheus_addr: str = "0.0.0.0"
     prometheus_enabled: bool = True
     grafana_enabled: bool = False
     grafana_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingConfig:
     """Trading settings"""
     symbols: List[str] = field(default_factory=lambda: ["BTCUSDT"])
+    candle_resolution: str = "1m"
     close_on_shutdown: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging settings"""
     log_dir: str = "/home/vibhavaggarwal/oracle-trading-system/logs"
@@ -93,7 +98,7 @@ class LoggingConfig:
     json_format: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration container"""
     environment: str = "development"
@@ -123,65 +128,120 @@ class Config:
             self.logging = LoggingConfig()
 
 
+def _to_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# (env var, config section or None for top level, attribute, parser)
+_ENV_OVERRIDES = (
+    ("ORACLE_ENV", None, "environment", str),
+    ("ORACLE_DEBUG", None, "debug", _to_bool),
+    ("PROMETHEUS_PORT", "monitoring", "prometheus_port", int),
+    ("PROMETHEUS_ADDR", "monitoring", "prometheus_addr", str),
+)
+
+# (env var, ExchangeConfig attribute, parser); applied over the file's section
+_EXCHANGE_ENV = (
+    ("DELTA_API_KEY", "api_key", str),
+    ("DELTA_API_SECRET", "api_secret", str),
+    ("DELTA_BASE_URL", "base_url", str),
+    ("DELTA_WS_URL", "ws_url", str),
+    ("DELTA_TESTNET", "testnet", _to_bool),
+)
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """
     Load configuration from environment and optional config file.
     Environment variables take precedence.
     """
     config = Config()
+    file_exchange: dict = {}
     
     # Load from file if provided
     if config_path and Path(config_path).exists():
-        with open(config_path) as f:
-            data = json.load(f)
+        with open(config_path, "rb") as f:
+            data = orjson.loads(f.read())
             _apply_dict_to_config(config, data)
+        if isinstance(data.get("exchange"), dict):
+            file_exchange = data["exchange"]
     
     # Override with environment variables
-    config.environment = os.getenv("ORACLE_ENV", config.environment)
-    config.debug = os.getenv("ORACLE_DEBUG", "false").lower() == "true"
-
-    # Monitoring config
-    prometheus_port = os.getenv("PROMETHEUS_PORT", "8080")
-    config.monitoring.prometheus_port = int(prometheus_port)
+    env = os.environ
+    for var, section, attr, parse in _ENV_OVERRIDES:
+        if var in env:
+            target = getattr(config, section) if section else config
+            setattr(target, attr, parse(env[var]))
     
-    # Exchange config from environment
-    api_key = os.getenv("DELTA_API_KEY", "")
-    api_secret = os.getenv("DELTA_API_SECRET", "")
-    
-    if api_key and api_secret:
-        config.exchange = ExchangeConfig(
-            name="delta",
-            api_key=api_key,
-            api_secret=api_secret,
-            base_url=os.getenv("DELTA_BASE_URL", "https://api.india.delta.exchange"),
-            testnet=os.getenv("DELTA_TESTNET", "false").lower() == "true"
-        )
+    # Exchange config: file section with DELTA_* environment on top
+    exchange = _build_exchange_config(file_exchange, env)
+    if exchange:
+        config.exchange = exchange
     
     # Alerts from environment
-    if os.getenv("TELEGRAM_BOT_TOKEN"):
+    if env.get("TELEGRAM_BOT_TOKEN"):
         config.alerts.telegram_enabled = True
-        config.alerts.telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN", "")
-        config.alerts.telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID", "")
+        config.alerts.telegram_bot_token = env["TELEGRAM_BOT_TOKEN"]
+        config.alerts.telegram_chat_id = env.get("TELEGRAM_CHAT_ID", "")
     
-    # Validate
+    # Validate, then freeze the hot-path sections
     _validate_config(config)
+    config.strategy = _freeze(config.strategy, FrozenStrategyConfig)
+    config.risk = _freeze(config.risk, FrozenRiskConfig)
     
     logger.info(f"Configuration loaded: env={config.environment}, debug={config.debug}")
     return config
 
 
+# Immutable runtime views of the sections read on every signal/risk check.
+# Loading and env overrides work on the dataclasses; load_config swaps in
+# these tuples once the values are validated.
+FrozenStrategyConfig = namedtuple("FrozenStrategyConfig", [f.name for f in fields(StrategyConfig)])
+FrozenRiskConfig = namedtuple("FrozenRiskConfig", [f.name for f in fields(RiskConfig)])
+
+
+def _freeze(section, frozen_type):
+    return frozen_type(*(getattr(section, f.name) for f in fields(section)))
+
+
+# Nested config sections, keyed by their attribute name on Config. The
+# exchange section is merged with the environment in _build_exchange_config.
+_SECTION_TYPES = {
+    "strategy": StrategyConfig,
+    "risk": RiskConfig,
+    "alerts": AlertConfig,
+    "monitoring": MonitoringConfig,
+    "trading": TradingConfig,
+    "logging": LoggingConfig,
+}
+
+
 def _apply_dict_to_config(config: Config, data: dict):
     """Apply dictionary values to config object"""
     for key, value in data.items():
-        if hasattr(config, key):
-            if key == "strategy" and isinstance(value, dict):
-                config.strategy = StrategyConfig(**value)
-            elif key == "risk" and isinstance(value, dict):
-                config.risk = RiskConfig(**value)
-            elif key == "alerts" and isinstance(value, dict):
-                config.alerts = AlertConfig(**value)
-            else:
-                setattr(config, key, value)
+        if key == "exchange" or not hasattr(config, key):
+            continue
+        section = _SECTION_TYPES.get(key)
+        if section:
+            # null or malformed sections keep their defaults
+            if isinstance(value, dict):
+                setattr(config, key, section(**value))
+        else:
+            setattr(config, key, value)
+
+
+def _build_exchange_config(file_values: dict, env) -> Optional[ExchangeConfig]:
+    """
+    Merge the file's exchange section with DELTA_* env vars (env wins).
+    Returns None unless both API credentials are known.
+    """
+    values = {"name": "delta", "base_url": "https://api.india.delta.exchange", **file_values}
+    for var, attr, parse in _EXCHANGE_ENV:
+        if env.get(var):
+            values[attr] = parse(env[var])
+    if not (values.get("api_key") and values.get("api_secret")):
+        return None
+    return ExchangeConfig(**values)
 
 
 def _validate_config(config: Config):
@@ -5,17 +5,16 @@ Exchange Client - Production Grade
 import hmac
 import hashlib
 import time
-import json
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import orjson
 from functools import wraps
 import threading
 
+from . import __version__
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,14 +40,14 @@ class RateLimitError(ExchangeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     asset: str
     available: float
     total: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     symbol: str
     side: str
@@ -59,16 +58,17 @@ class Position:
 
 class RateLimiter:
     def __init__(self, rps: int = 10):
-        self.min_interval = 1.0 / rps
-        self.last = 0
+        self.min_interval_ns = 10**9 // rps
+        self.last_ns = 0
         self.lock = threading.Lock()
     
     def wait(self):
+        # Monotonic integer clock: immune to NTP/wall-clock jumps
         with self.lock:
-            elapsed = time.time() - self.last
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
-            self.last = time.time()
+            elapsed_ns = time.monotonic_ns() - self.last_ns
+            if elapsed_ns < self.min_interval_ns:
+                time.sleep((self.min_interval_ns - elapsed_ns) / 1e9)
+            self.last_ns = time.monotonic_ns()
 
 
 class DeltaExchangeClient:
@@ -76,40 +76,71 @@ class DeltaExchangeClient:
     
     def __init__(self, api_key: str, api_secret: str, 
                  base_url: str = "https://api.india.delta.exchange",
-                 timeout: int = 30):
+                 timeout: int = 30, pool_maxsize: int = 10,
+                 balance_ttl: float = 0.5):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.rate_limiter = RateLimiter(10)
         self._product_cache = {}
+        # (monotonic expiry, balances, balances by asset); dropped by
+        # invalidate_balances() on fills
+        self.balance_ttl = balance_ttl
+        self._balances_cache: Optional[Tuple[float, List[Balance], Dict[str, Balance]]] = None
+        # Keyed HMAC state is built once; each signature copies it instead of
+        # re-running the key schedule.
+        self._hmac_template = hmac.new(api_secret.encode(), b"", hashlib.sha256)
+        self._static_headers = {"api-key": api_key}
+        # HMAC state already fed the method prefix, one per HTTP method
+        self._sig_prefix_cache: Dict[str, hmac.HMAC] = {}
+        
+        # Imported here so config/health tooling can load this module without
+        # paying for the HTTP stack
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         
+        # One keep-alive pool per host, sized to the engine's concurrent callers
+        # so parallel symbol workers reuse TLS connections instead of
+        # opening throwaway ones past the pool limit.
         self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": f"oracle-trading-system/{__version__}",
+            "Content-Type": "application/json",
+        })
         retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
-        self.session.mount("https://", HTTPAdapter(max_retries=retry, pool_maxsize=10))
+        self.session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=1,
+                                                   pool_maxsize=pool_maxsize))
         logger.info(f"Exchange client initialized: {base_url}")
     
-    def _sign(self, method: str, path: str, body: str = "") -> Dict[str, str]:
+    def _sign(self, method: str, path: str, body: bytes = b"") -> Dict[str, str]:
         ts = str(int(time.time()))
-        sig = hmac.new(self.api_secret.encode(), 
-                       (method + ts + path + body).encode(), 
-                       hashlib.sha256).hexdigest()
-        return {"api-key": self.api_key, "timestamp": ts, "signature": sig, "Content-Type": "application/json"}
+        # Delta signs method + timestamp + path + body, so the timestamp splits
+        # method from path and only the method prefix can be memoized.
+        prefix = self._sig_prefix_cache.get(method)
+        if prefix is None:
+            prefix = self._hmac_template.copy()
+            prefix.update(method.encode())
+            self._sig_prefix_cache[method] = prefix
+        h = prefix.copy()
+        h.update((ts + path).encode() + body)
+        return {**self._static_headers, "timestamp": ts, "signature": h.hexdigest()}
     
     def _request(self, method: str, path: str, body: Optional[Dict] = None) -> Dict:
         self.rate_limiter.wait()
         url = f"{self.base_url}{path}"
-        body_str = json.dumps(body) if body else ""
-        headers = self._sign(method, path, body_str)
+        body_bytes = orjson.dumps(body) if body else b""
+        headers = self._sign(method, path, body_bytes)
         
         if method == "GET":
             r = self.session.get(url, headers=headers, timeout=self.timeout)
         elif method == "POST":
-            r = self.session.post(url, headers=headers, data=body_str, timeout=self.timeout)
+            r = self.session.post(url, headers=headers, data=body_bytes, timeout=self.timeout)
         else:
             r = self.session.delete(url, headers=headers, timeout=self.timeout)
         
-        data = r.json()
+        data = orjson.loads(r.content)
         if not data.get("success", True):
             err = data.get("error", {}).get("code", "unknown")
             if "auth" in err or "key" in err or "whitelist" in err:
@@ -117,18 +148,41 @@ class DeltaExchangeClient:
             raise ExchangeError(err)
         return data
     
-    def get_balances(self) -> List[Balance]:
+    def _fetch_balances(self) -> Tuple[float, List[Balance], Dict[str, Balance]]:
+        cached = self._balances_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached
         data = self._request("GET", "/v2/wallet/balances")
-        return [Balance(i.get("asset_symbol",""), float(i.get("available_balance",0)), 
-                        float(i.get("balance",0))) for i in data.get("result", [])]
+        _float = float
+        balances = [Balance(i["asset_symbol"], _float(i["available_balance"]), _float(i["balance"]))
+                    for i in data["result"]]
+        cached = (time.monotonic() + self.balance_ttl, balances, {b.asset: b for b in balances})
+        self._balances_cache = cached
+        return cached
+    
+    def get_balances(self) -> List[Balance]:
+        return self._fetch_balances()[1]
+    
+    def get_balances_map(self) -> Dict[str, Balance]:
+        """Balances keyed by asset symbol"""
+        return self._fetch_balances()[2]
+    
+    def invalidate_balances(self) -> None:
+        """Drop the cached balances (call after anything that moves funds)"""
+        self._balances_cache = None
     
     def get_positions(self) -> List[Position]:
         data = self._request("GET", "/v2/positions")
-        return [Position(i.get("product_symbol",""), 
-                        "long" if float(i.get("size",0)) > 0 else "short",
-                        abs(float(i.get("size",0))), float(i.get("entry_price",0)),
-                        float(i.get("unrealized_pnl",0))) 
-                for i in data.get("result",[]) if float(i.get("size",0)) != 0]
+        _float = float
+        out: List[Position] = []
+        out_append = out.append
+        for i in data["result"]:
+            size = _float(i["size"])
+            if size == 0.0:
+                continue
+            out_append(Position(i["product_symbol"], "long" if size > 0 else "short", abs(size),
+                                _float(i["entry_price"]), _float(i["unrealized_pnl"])))
+        return out
     
     def test_connection(self) -> bool:
         try:
@@ -9,22 +9,30 @@ Professional logging with:
 - Performance metrics
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
-import json
+import queue
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 import traceback
 
+import orjson
+
+# Non-str keys (e.g. ints in extra metrics) are coerced as json.dumps did
+_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON structured log formatter for production"""
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -53,7 +61,8 @@ class StructuredFormatter(logging.Formatter):
                 "traceback": traceback.format_exception(*record.exc_info) if record.exc_info[0] else None
             }
         
-        return json.dumps(log_data)
+        # orjson formats the datetime in C; default=str keeps odd extras loggable
+        return orjson.dumps(log_data, default=str, option=_JSON_OPTIONS).decode()
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -69,11 +78,12 @@ class ConsoleFormatter(logging.Formatter):
     RESET = "\033[0m"
     
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.RESET)
+        reset = self.RESET
+        color = self.COLORS.get(record.levelname, reset)
         
-        # Build message
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        level = f"{color}{record.levelname:8}{self.RESET}"
+        # Build message (record.created already holds the event time)
+        timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+        level = f"{color}{record.levelname:8}{reset}"
         
         msg = f"[{timestamp}] {level} | {record.name}: {record.getMessage()}"
         
@@ -84,11 +94,38 @@ class ConsoleFormatter(logging.Formatter):
             msg += f" | {record.action}"
         if hasattr(record, "pnl"):
             pnl_color = "\033[32m" if record.pnl >= 0 else "\033[31m"
-            msg += f" | PnL: {pnl_color}${record.pnl:+.2f}{self.RESET}"
+            msg += f" | PnL: {pnl_color}${record.pnl:+.2f}{reset}"
         
         return msg
 
 
+class TradeRecordFilter(logging.Filter):
+    """Pass only records carrying trade extras (trade_id or action)"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Extras land in the instance dict; a key check avoids hasattr's
+        # AttributeError path on the common miss
+        d = record.__dict__
+        return "trade_id" in d or "action" in d
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process listener.
+
+    The stock prepare() bakes the traceback into the message and drops
+    exc_info, which would lose the structured "exception" field in the JSON
+    file logs. Records never leave the process, so only the message is
+    resolved up front.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class TradeLogger:
     """Specialized logger for trade events"""
     
@@ -151,6 +188,20 @@ class TradeLogger:
         )
 
 
+# Background listener draining the file handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging(
     log_dir: str = "/home/vibhavaggarwal/oracle-trading-system/logs",
     log_level: str = "INFO",
@@ -169,20 +220,26 @@ def setup_logging(
     Returns:
         Configured root logger
     """
+    global _queue_listener
+    
     # Create log directory
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
+    oracle_log, trades_log, errors_log = (
+        str(log_path / name) for name in ("oracle.log", "trades.log", "errors.log")
+    )
     
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
     # Clear existing handlers
+    _stop_queue_listener()
     root_logger.handlers = []
     
     # File handler with rotation (10MB max, keep 5 files)
     file_handler = logging.handlers.RotatingFileHandler(
-        log_path / "oracle.log",
+        oracle_log,
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5,
         encoding="utf-8"
@@ -196,30 +253,36 @@ def setup_logging(
             "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
         ))
     
-    root_logger.addHandler(file_handler)
-    
     # Trade-specific log file
     trade_handler = logging.handlers.RotatingFileHandler(
-        log_path / "trades.log",
+        trades_log,
         maxBytes=10 * 1024 * 1024,
         backupCount=10,
         encoding="utf-8"
     )
     trade_handler.setLevel(logging.INFO)
     trade_handler.setFormatter(StructuredFormatter())
-    trade_handler.addFilter(lambda r: hasattr(r, "trade_id") or hasattr(r, "action"))
-    root_logger.addHandler(trade_handler)
+    trade_handler.addFilter(TradeRecordFilter())
     
     # Error log file
     error_handler = logging.handlers.RotatingFileHandler(
-        log_path / "errors.log",
+        errors_log,
         maxBytes=5 * 1024 * 1024,
         backupCount=5,
         encoding="utf-8"
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(StructuredFormatter())
-    root_logger.addHandler(error_handler)
+    
+    # File I/O (including rotation) runs on the listener thread so the
+    # trading thread never blocks on disk writes
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, trade_handler, error_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(LocalQueueHandler(log_queue))
     
     # Console handler for development
     if console:
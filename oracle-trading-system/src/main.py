@@ -3,23 +3,33 @@
 Oracle Trading Engine - Production Main Entry Point
 """
 
+import queue
 import signal
 import sys
 import time
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Optional, Dict, Any, List, Mapping
+from datetime import datetime, timedelta
 import threading
 
 from .config import load_config, Config
 from .logger import setup_logging, TradeLogger
-from .exchange import DeltaExchangeClient
+from .exchange import DeltaExchangeClient, ExchangeError
+from .market_data import CandleFeed
 from .strategy import OracleStrategy, Signal
 from .risk_manager import RiskManager, RiskAction, Position
 from .metrics import init_metrics, TradingMetrics
 
 __version__ = "2.0.0"
 
+TICK_INTERVAL = 60  # seconds between account refreshes
+
+# Exchange rejections and network failures (requests' exceptions derive from
+# OSError) tend to arrive in bursts; only the first of each type gets a traceback
+_EXPECTED_ERRORS = (ExchangeError, OSError)
+
 
 class OracleTradingEngine:
     def __init__(self, config: Config):
@@ -30,12 +40,28 @@ class OracleTradingEngine:
         self.strategy: Optional[OracleStrategy] = None
         self.risk_manager: Optional[RiskManager] = None
         self.metrics: Optional[TradingMetrics] = None
+        self.feed: Optional[CandleFeed] = None
+        # Closed candles handed over from the feed thread
+        self._candle_queue: queue.SimpleQueue = queue.SimpleQueue()
         self._running = False
         self._healthy = False
-        self._last_heartbeat = datetime.utcnow()
+        self._last_heartbeat = time.monotonic_ns()
         self._trade_count = 0
-        self._start_time: Optional[datetime] = None
+        self._start_ns: Optional[int] = None
         self._shutdown_event = threading.Event()
+        self._seen_errors: set = set()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Entries are serialized so check_trade_allowed + register_position
+        # stay atomic; exits only contend per symbol.
+        self._entry_lock = threading.Lock()
+        self._symbol_locks = {s: threading.Lock() for s in config.trading.symbols}
+        self._stats_lock = threading.Lock()
+        self._signal_dispatch = {
+            Signal.LONG: self._handle_entry,
+            Signal.SHORT: self._handle_entry,
+            Signal.EXIT_LONG: self._handle_exit,
+            Signal.EXIT_SHORT: self._handle_exit,
+        }
         self._wins = 0
         self._losses = 0
         self._consecutive_losses = 0
@@ -57,20 +83,24 @@ class OracleTradingEngine:
         try:
             # Initialize metrics server
             self.logger.info("Initializing metrics server...")
-            self.metrics = init_metrics(port=self.config.monitoring.prometheus_port)
+            monitoring = self.config.monitoring
+            self.metrics = init_metrics(port=monitoring.prometheus_port,
+                                        symbols=self.config.trading.symbols,
+                                        addr=monitoring.prometheus_addr)
 
             self.logger.info("Initializing exchange client...")
+            symbols = self.config.trading.symbols
             self.exchange = DeltaExchangeClient(
                 api_key=self.config.exchange.api_key,
                 api_secret=self.config.exchange.api_secret,
                 base_url=self.config.exchange.base_url,
-                timeout=self.config.exchange.timeout
+                timeout=self.config.exchange.timeout,
+                pool_maxsize=max(10, len(symbols) + 1)
             )
             if not self.exchange.test_connection():
                 self.logger.error("Exchange connection test failed")
                 return False
-            balances = self.exchange.get_balances()
-            usdt = next((b for b in balances if b.asset == "USDT"), None)
+            usdt = self.exchange.get_balances_map().get("USDT")
             if usdt:
                 self.logger.info(f"Balance: ${usdt.available:.2f} USDT")
                 self._peak_balance = usdt.available
@@ -81,6 +111,12 @@ class OracleTradingEngine:
             self.risk_manager = RiskManager(self.config)
             if usdt:
                 self.risk_manager.update_equity(usdt.available)
+            self._pool = ThreadPoolExecutor(max_workers=max(1, min(32, len(symbols))),
+                                            thread_name_prefix="oracle-signal")
+            self.logger.info("Starting market data feed...")
+            self.feed = CandleFeed(self.config.exchange.ws_url, symbols, self._on_candle,
+                                   self.config.trading.candle_resolution)
+            self.feed.start()
             self._healthy = True
             self.logger.info("Initialization complete!")
             return True
@@ -88,18 +124,47 @@ class OracleTradingEngine:
             self.logger.exception(f"Initialization failed: {e}")
             return False
 
-    def _process_signal(self, symbol: str) -> None:
-        if not self.strategy or not self.risk_manager:
+    def _on_candle(self, symbol: str, candle: Dict) -> None:
+        """Feed-thread callback; candles are handed to the main loop"""
+        self._candle_queue.put((symbol, candle))
+
+    def _drain_candles(self, timeout: float) -> Dict[str, List[Dict]]:
+        """
+        Wait up to timeout for closed candles and return every queued one,
+        grouped by symbol in arrival order.
+        """
+        try:
+            symbol, candle = self._candle_queue.get(timeout=max(timeout, 0))
+        except queue.Empty:
+            return {}
+        batches: Dict[str, List[Dict]] = {}
+        while True:
+            batches.setdefault(symbol, []).append(candle)
+            try:
+                symbol, candle = self._candle_queue.get_nowait()
+            except queue.Empty:
+                return batches
+
+    def _process_candles(self, symbol: str, candles: List[Dict]) -> None:
+        """
+        Evaluate each closed candle in turn. A backlog (e.g. after a slow
+        account refresh) must not be collapsed into its last bar, since the
+        entry rules compare consecutive bars.
+        """
+        for candle in candles:
+            self.strategy.update_candle(symbol, candle)
+            self._process_signal(symbol, self.risk_manager.get_positions())
+
+    def _process_signal(self, symbol: str, positions: Mapping[str, Position]) -> None:
+        if not self.strategy or not self.risk_manager or self._shutdown_event.is_set():
             return
-        start_time = time.time()
-        positions = self.risk_manager.get_positions()
+        start_ns = time.perf_counter_ns()
         current = positions.get(symbol)
         side = current.side if current else None
         sig = self.strategy.generate_signal(symbol, side)
 
         # Record signal latency
-        latency = time.time() - start_time
-        self.metrics.signal_latency.observe(latency)
+        self.metrics.signal_latency.observe((time.perf_counter_ns() - start_ns) / 1e9)
 
         if sig.signal == Signal.HOLD:
             return
@@ -108,16 +173,27 @@ class OracleTradingEngine:
         self.metrics.record_signal(symbol, sig.signal.value)
         self.trade_logger.log_signal(symbol, sig.signal.value, sig.indicators)
 
-        if sig.signal in [Signal.LONG, Signal.SHORT]:
+        handler = self._signal_dispatch.get(sig.signal)
+        if handler:
+            handler(sig, current)
+
+    def _handle_entry(self, sig, current: Optional[Position]) -> None:
+        with self._entry_lock:
             self._execute_entry(sig)
-        elif sig.signal in [Signal.EXIT_LONG, Signal.EXIT_SHORT]:
-            self._execute_exit(symbol, sig)
+
+    def _handle_exit(self, sig, current: Optional[Position]) -> None:
+        with self._symbol_locks[sig.symbol]:
+            # Re-read under the lock: the batch snapshot may predate a
+            # close-all that already flattened this symbol
+            pos = self.risk_manager.get_positions().get(sig.symbol)
+            self._execute_exit(sig.symbol, sig, pos)
 
     def _execute_entry(self, sig) -> None:
         symbol = sig.symbol
         side = "buy" if sig.signal == Signal.LONG else "sell"
-        balances = self.exchange.get_balances()
-        usdt = next((b for b in balances if b.asset == "USDT"), None)
+        # Served from the client's short-lived balance cache, which every
+        # fill invalidates
+        usdt = self.exchange.get_balances_map().get("USDT")
         if not usdt or usdt.available < 10:
             self.logger.warning("Insufficient balance")
             return
@@ -134,6 +210,7 @@ class OracleTradingEngine:
         try:
             trade_id = f"oracle_{int(time.time()*1000)}"
             order = self.exchange.place_order(symbol, side, size, "market")
+            self.exchange.invalidate_balances()
             if order:
                 entry = sig.price
                 sl = self.strategy.get_stop_loss_price(entry, side)
@@ -149,16 +226,15 @@ class OracleTradingEngine:
 
                 self.logger.info(f"Opened {side.upper()} {symbol} @ {entry:.4f}")
         except Exception as e:
-            self.logger.exception(f"Entry failed: {e}")
+            self._log_failure("Entry", e)
 
-    def _execute_exit(self, symbol: str, sig) -> None:
-        positions = self.risk_manager.get_positions()
-        pos = positions.get(symbol)
+    def _execute_exit(self, symbol: str, sig, pos: Optional[Position]) -> None:
         if not pos:
             return
         try:
             close_side = "sell" if pos.side == "buy" else "buy"
             order = self.exchange.place_order(symbol, close_side, pos.size, "market")
+            self.exchange.invalidate_balances()
             if order:
                 exit_price = sig.price
                 if pos.side == "buy":
@@ -167,75 +243,120 @@ class OracleTradingEngine:
                     pnl = (pos.entry_price - exit_price) * pos.size
 
                 # Update trade statistics
-                self._total_pnl += pnl
-                self._daily_pnl += pnl
-                if pnl > 0:
-                    self._wins += 1
-                    self._consecutive_losses = 0
-                else:
-                    self._losses += 1
-                    self._consecutive_losses += 1
-
-                # Record metrics
-                self.metrics.record_trade(symbol, pos.side, pnl)
-                win_rate = self._wins / (self._wins + self._losses) if (self._wins + self._losses) > 0 else 0
-                self.metrics.update_performance(win_rate, self._consecutive_losses)
-                self.metrics.update_pnl(self._daily_pnl, self._total_pnl)
+                with self._stats_lock:
+                    self._total_pnl += pnl
+                    self._daily_pnl += pnl
+                    is_win = int(pnl > 0)
+                    self._wins += is_win
+                    self._losses += 1 - is_win
+                    self._consecutive_losses = (self._consecutive_losses + 1) * (1 - is_win)
+
+                    # Record metrics (this trade makes the count non-zero)
+                    metrics = self.metrics
+                    metrics.record_trade(symbol, pos.side, pnl)
+                    win_rate = self._wins / (self._wins + self._losses)
+                    metrics.update_performance(win_rate, self._consecutive_losses)
+                    metrics.update_pnl(self._daily_pnl, self._total_pnl)
 
                 # Update position count
-                self.risk_manager.close_position(symbol, exit_price, pnl, sig.reason)
-                positions_count = len(self.risk_manager.get_positions())
-                self.metrics.update_positions(positions_count)
+                risk_manager = self.risk_manager
+                risk_manager.close_position(symbol, exit_price, pnl, sig.reason)
+                self.metrics.update_positions(len(risk_manager.get_positions()))
 
                 self.trade_logger.log_exit(symbol, pos.trade_id, exit_price, pos.entry_price, pnl, sig.reason)
                 self.logger.info(f"Closed {symbol} @ {exit_price:.4f} PnL: {pnl:+.2f}")
         except Exception as e:
-            self.logger.exception(f"Exit failed: {e}")
+            self._log_failure("Exit", e)
+
+    def _log_failure(self, action: str, e: Exception) -> None:
+        if isinstance(e, _EXPECTED_ERRORS) and type(e) in self._seen_errors:
+            self.logger.error(f"{action} failed: {e}")
+            return
+        self._seen_errors.add(type(e))
+        self.logger.exception(f"{action} failed: {e}")
 
     def _close_all_positions(self, reason: str) -> None:
-        for symbol, pos in self.risk_manager.get_positions().items():
-            try:
-                close_side = "sell" if pos.side == "buy" else "buy"
-                self.exchange.place_order(symbol, close_side, pos.size, "market")
-                self.logger.warning(f"Closed {symbol}: {reason}")
-            except Exception as e:
-                self.logger.error(f"Failed close {symbol}: {e}")
+        with ExitStack() as stack:
+            # Hold every symbol lock (in a fixed order) before reading the
+            # positions, so an exit that finished while we waited isn't
+            # closed a second time
+            for symbol in sorted(self._symbol_locks):
+                stack.enter_context(self._symbol_locks[symbol])
+            positions = self.risk_manager.get_positions()
+            if not positions:
+                return
+            # Send the closes in parallel. This can run inside a signal worker
+            # while other workers wait on these locks, so use a separate
+            # executor rather than self._pool.
+            with ThreadPoolExecutor(max_workers=min(32, len(positions)),
+                                    thread_name_prefix="oracle-close") as closer:
+                for symbol, pos in positions.items():
+                    closer.submit(self._close_position, symbol, pos, reason)
+
+    def _close_position(self, symbol: str, pos: Position, reason: str) -> None:
+        try:
+            close_side = "sell" if pos.side == "buy" else "buy"
+            self.exchange.place_order(symbol, close_side, pos.size, "market")
+            self.exchange.invalidate_balances()
+            self.logger.warning(f"Closed {symbol}: {reason}")
+        except Exception as e:
+            self.logger.error(f"Failed close {symbol}: {e}")
+
+    def _refresh_account(self) -> None:
+        """Pull the balance and publish equity, drawdown and health"""
+        usdt = self.exchange.get_balances_map().get("USDT")
+        if usdt:
+            self.risk_manager.update_equity(usdt.available)
+
+            # Update metrics
+            self.metrics.update_balance(usdt.available)
+            if usdt.available > self._peak_balance:
+                self._peak_balance = usdt.available
+
+            # Calculate drawdown from peak
+            if self._peak_balance > 0:
+                drawdown = (self._peak_balance - usdt.available) / self._peak_balance
+                # Track max drawdown separately
+                if not hasattr(self, '_max_drawdown'):
+                    self._max_drawdown = 0
+                self._max_drawdown = max(self._max_drawdown, drawdown)
+                self.metrics.update_drawdown(drawdown, self._max_drawdown)
+
+        # Update health metrics
+        self.metrics.update_health(self._healthy, self._uptime())
+        self._last_heartbeat = time.monotonic_ns()
 
     def _main_loop(self) -> None:
+        """
+        Event loop: closed candles from the feed trigger signal evaluation as
+        they arrive; the account is refreshed every TICK_INTERVAL on an
+        absolute monotonic schedule so work time does not cause drift.
+        """
         self.logger.info("Starting main loop...")
-        symbols = self.config.trading.symbols
-        while not self._shutdown_event.is_set():
+        # Bind hot call targets once instead of re-resolving each pass
+        refresh_account = self._refresh_account
+        drain_candles = self._drain_candles
+        pool_map = self._pool.map
+        process = self._process_candles
+        stopping = self._shutdown_event.is_set
+        next_refresh = time.monotonic()
+        while not stopping():
             try:
-                balances = self.exchange.get_balances()
-                usdt = next((b for b in balances if b.asset == "USDT"), None)
-                if usdt:
-                    self.risk_manager.update_equity(usdt.available)
-
-                    # Update metrics
-                    self.metrics.update_balance(usdt.available)
-                    if usdt.available > self._peak_balance:
-                        self._peak_balance = usdt.available
-
-                    # Calculate drawdown from peak
-                    if self._peak_balance > 0:
-                        drawdown = (self._peak_balance - usdt.available) / self._peak_balance
-                        # Track max drawdown separately
-                        if not hasattr(self, '_max_drawdown'):
-                            self._max_drawdown = 0
-                        self._max_drawdown = max(self._max_drawdown, drawdown)
-                        self.metrics.update_drawdown(drawdown, self._max_drawdown)
-
-                for symbol in symbols:
-                    if self._shutdown_event.is_set():
-                        break
-                    self._process_signal(symbol)
-
-                # Update health metrics
-                uptime = (datetime.utcnow() - self._start_time).total_seconds() if self._start_time else 0
-                self.metrics.update_health(self._healthy, uptime)
-
-                self._last_heartbeat = datetime.utcnow()
-                self._shutdown_event.wait(60)
+                now = time.monotonic()
+                if now >= next_refresh:
+                    refresh_account()
+                    missed = int((time.monotonic() - next_refresh) // TICK_INTERVAL)
+                    if missed:
+                        self.logger.warning(f"Account refresh overran schedule, skipping {missed} tick(s)")
+                    next_refresh += (missed + 1) * TICK_INTERVAL
+
+                # Short wait slices keep shutdown responsive while idle
+                batches = drain_candles(min(next_refresh - time.monotonic(), 1.0))
+                if batches:
+                    # Symbols are independent (each worker owns one symbol's
+                    # strategy state); overlap their exchange round-trips
+                    for _ in pool_map(process, batches.keys(), batches.values()):
+                        pass
             except Exception as e:
                 self.logger.exception(f"Loop error: {e}")
                 self._healthy = False
@@ -248,7 +369,7 @@ class OracleTradingEngine:
         if not self.initialize():
             return 1
         self._running = True
-        self._start_time = datetime.utcnow()
+        self._start_ns = time.monotonic_ns()
         try:
             self._main_loop()
         except Exception as e:
@@ -262,18 +383,26 @@ class OracleTradingEngine:
         self.logger.info("Shutting down...")
         self._running = False
         self._healthy = False
+        if self.feed:
+            self.feed.stop()
         if self.config.trading.close_on_shutdown:
             self._close_all_positions("Shutdown")
-        if self._start_time:
-            self.logger.info(f"Uptime: {datetime.utcnow() - self._start_time}")
+        if self._pool:
+            self._pool.shutdown(wait=True)
+        if self._start_ns:
+            self.logger.info(f"Uptime: {timedelta(seconds=self._uptime())}")
             self.logger.info(f"Trades: {self._trade_count}")
         self.logger.info("Shutdown complete")
 
+    def _uptime(self) -> float:
+        """Seconds since run() started, from the monotonic clock"""
+        return (time.monotonic_ns() - self._start_ns) / 1e9 if self._start_ns else 0
+
     def get_health(self) -> Dict[str, Any]:
         return {
             "healthy": self._healthy,
             "running": self._running,
-            "uptime": (datetime.utcnow() - self._start_time).total_seconds() if self._start_time else 0,
+            "uptime": self._uptime(),
             "trades": self._trade_count,
             "version": __version__
         }
@@ -0,0 +1,123 @@
+"""
+Market Data Feed
+================
+Streams candles from the Delta Exchange WebSocket so the engine reacts to
+bar closes instead of polling on a fixed timer.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+import orjson
+import websocket
+
+logger = logging.getLogger(__name__)
+
+CandleCallback = Callable[[str, Dict], None]
+
+_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _bar_micros(resolution: str) -> int:
+    """Bar length in microseconds, the unit of Delta's candle_start_time"""
+    return int(resolution[:-1]) * _UNIT_SECONDS[resolution[-1]] * 1_000_000
+
+
+class CandleFeed:
+    """
+    Subscribes to a candlestick channel and reports each candle once closed.
+
+    Delta pushes the in-progress candle on every trade; a candle is final
+    when an update for a newer candle_start_time arrives for that symbol.
+    The socket runs on a daemon thread and reconnects until stopped; each
+    reconnect starts from a clean slate so a candle whose closing updates
+    were missed while offline is never reported.
+    """
+
+    def __init__(self, url: str, symbols: List[str], on_candle: CandleCallback,
+                 resolution: str = "1m", reconnect_delay: float = 5.0):
+        self.url = url
+        self.symbols = list(symbols)
+        self.channel = f"candlestick_{resolution}"
+        self._bar_us = _bar_micros(resolution)
+        self.on_candle = on_candle
+        self.reconnect_delay = reconnect_delay
+        self._open: Dict[str, Dict] = {}  # in-progress candle per symbol
+        self._last_start: Dict[str, int] = {}  # start of last reported candle
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._ws: Optional[websocket.WebSocketApp] = None
+
+    def start(self) -> None:
+        """Start the feed thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="oracle-candles", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close the socket and wait for the feed thread to exit"""
+        self._stop.set()
+        if self._ws:
+            self._ws.close()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._ws = websocket.WebSocketApp(
+                self.url,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error,
+            )
+            # orjson validates UTF-8 while parsing, so skip websocket-client's
+            # pure-Python per-frame validation pass
+            self._ws.run_forever(ping_interval=30, ping_timeout=10, skip_utf8_validation=True)
+            if not self._stop.is_set():
+                logger.warning(f"Candle feed disconnected, reconnecting in {self.reconnect_delay:.0f}s")
+                self._stop.wait(self.reconnect_delay)
+
+    def _on_open(self, ws) -> None:
+        self._open.clear()
+        ws.send(orjson.dumps({
+            "type": "subscribe",
+            "payload": {"channels": [{"name": self.channel, "symbols": self.symbols}]},
+        }))
+        logger.info(f"Candle feed subscribed: {self.channel} {self.symbols}")
+
+    def _on_message(self, ws, message) -> None:
+        try:
+            msg = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Dropping malformed feed message: {message[:200]!r}")
+            return
+        if not isinstance(msg, dict) or msg.get("type") != self.channel:
+            return
+
+        symbol = msg.get("symbol")
+        start = msg.get("candle_start_time")
+        if start is None:
+            return
+        prev = self._open.get(symbol)
+        if prev is not None:
+            prev_start = prev.get("candle_start_time")
+            if start < prev_start:
+                return  # late update for a candle already superseded
+            if start > prev_start:
+                self._report(symbol, prev, prev_start)
+        self._open[symbol] = msg
+
+    def _report(self, symbol: str, candle: Dict, start: int) -> None:
+        last = self._last_start.get(symbol)
+        if last is not None:
+            missed = (start - last) // self._bar_us - 1
+            if missed > 0:
+                logger.warning(f"Candle feed gap on {symbol}: {missed} bar(s) missed")
+        self._last_start[symbol] = start
+        self.on_candle(symbol, candle)
+
+    def _on_error(self, ws, error) -> None:
+        logger.error(f"Candle feed error: {error}")
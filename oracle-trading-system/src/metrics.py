@@ -5,10 +5,10 @@ Exposes trading metrics for Prometheus scraping
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 from prometheus_client import (
     Counter, Gauge, Histogram, Summary,
-    start_http_server, REGISTRY
+    start_http_server, REGISTRY, GC_COLLECTOR, PLATFORM_COLLECTOR
 )
 import threading
 import time
@@ -31,8 +31,9 @@ class TradingMetrics:
     - oracle_api_errors_total: API error counter
     """
     
-    def __init__(self, port: int = 8080):
+    def __init__(self, port: int = 8080, symbols: Iterable[str] = (), addr: str = "0.0.0.0"):
         self.port = port
+        self.addr = addr
         self._server_started = False
         
         # Trade metrics
@@ -132,28 +133,74 @@ class TradingMetrics:
             "Bot health status (1=healthy, 0=unhealthy)"
         )
         
+        # Labelled children resolved once instead of on every increment;
+        # known symbols are pre-bound so their series exist from startup
+        self._trade_counters: Dict[Tuple[str, str, str], Counter] = {}
+        self._signal_counters: Dict[Tuple[str, str], Counter] = {}
+        # Last value written per gauge; unchanged values skip the gauge write.
+        # Updates arrive from the main loop and the signal pool, so the
+        # compare and the write happen under one lock
+        self._shadow: Dict[Gauge, float] = {}
+        self._shadow_lock = threading.Lock()
+        for symbol in symbols:
+            for side in ("buy", "sell"):
+                for result in ("win", "loss"):
+                    self._trade_counter(symbol, side, result)
+            for signal_type in ("long", "short", "exit_long", "exit_short"):
+                self._signal_counter(symbol, signal_type)
+        
         logger.info(f"TradingMetrics initialized on port {port}")
     
+    def _set(self, gauge: Gauge, value: float) -> None:
+        with self._shadow_lock:
+            if self._shadow.get(gauge) == value:
+                return
+            self._shadow[gauge] = value
+            gauge.set(value)
+    
+    def _trade_counter(self, symbol: str, side: str, result: str) -> Counter:
+        key = (symbol, side, result)
+        child = self._trade_counters.get(key)
+        if child is None:
+            child = self._trade_counters[key] = self.trades_total.labels(
+                symbol=symbol, side=side, result=result)
+        return child
+    
+    def _signal_counter(self, symbol: str, signal_type: str) -> Counter:
+        key = (symbol, signal_type)
+        child = self._signal_counters.get(key)
+        if child is None:
+            child = self._signal_counters[key] = self.signals_generated.labels(
+                symbol=symbol, signal_type=signal_type)
+        return child
+    
     def start_server(self) -> None:
         """Start Prometheus HTTP server"""
         if self._server_started:
             return
+        # The GC and platform collectors add nothing the dashboards use and
+        # run inside the scrape; the process collector is kept
+        for collector in (GC_COLLECTOR, PLATFORM_COLLECTOR):
+            try:
+                REGISTRY.unregister(collector)
+            except KeyError:
+                pass
         try:
-            start_http_server(self.port)
+            start_http_server(self.port, addr=self.addr)
             self._server_started = True
-            logger.info(f"Prometheus metrics server started on port {self.port}")
+            logger.info(f"Prometheus metrics server started on {self.addr}:{self.port}")
         except Exception as e:
             logger.error(f"Failed to start metrics server: {e}")
     
     def record_trade(self, symbol: str, side: str, pnl: float) -> None:
         """Record a completed trade"""
         result = "win" if pnl > 0 else "loss"
-        self.trades_total.labels(symbol=symbol, side=side, result=result).inc()
+        self._trade_counter(symbol, side, result).inc()
         logger.debug(f"Recorded trade: {symbol} {side} {result}")
     
     def record_signal(self, symbol: str, signal_type: str) -> None:
         """Record a generated signal"""
-        self.signals_generated.labels(symbol=symbol, signal_type=signal_type).inc()
+        self._signal_counter(symbol, signal_type).inc()
     
     def record_api_request(self, endpoint: str, method: str, 
                            latency: float, error: Optional[str] = None) -> None:
@@ -165,30 +212,30 @@ class TradingMetrics:
     
     def update_balance(self, balance: float) -> None:
         """Update current balance"""
-        self.balance.set(balance)
+        self._set(self.balance, balance)
     
     def update_pnl(self, daily: float, total: float) -> None:
         """Update PnL metrics"""
-        self.pnl_daily.set(daily)
-        self.pnl_total.set(total)
+        self._set(self.pnl_daily, daily)
+        self._set(self.pnl_total, total)
     
     def update_positions(self, count: int) -> None:
         """Update open positions count"""
-        self.positions_open.set(count)
+        self._set(self.positions_open, count)
     
     def update_drawdown(self, current: float, maximum: float) -> None:
         """Update drawdown metrics"""
-        self.drawdown.set(current * 100)
-        self.max_drawdown.set(maximum * 100)
+        self._set(self.drawdown, current * 100)
+        self._set(self.max_drawdown, maximum * 100)
     
     def update_performance(self, win_rate: float, consecutive_losses: int) -> None:
         """Update performance metrics"""
-        self.win_rate.set(win_rate * 100)
-        self.consecutive_losses.set(consecutive_losses)
+        self._set(self.win_rate, win_rate * 100)
+        self._set(self.consecutive_losses, consecutive_losses)
     
     def update_health(self, healthy: bool, uptime_seconds: float) -> None:
         """Update health metrics"""
-        self.healthy.set(1 if healthy else 0)
+        self._set(self.healthy, 1 if healthy else 0)
         self.uptime.set(uptime_seconds)
         self.last_heartbeat.set(time.time())
 
@@ -197,16 +244,18 @@ class TradingMetrics:
 _metrics: Optional[TradingMetrics] = None
 
 
-def get_metrics(port: int = 8080) -> TradingMetrics:
+def get_metrics(port: int = 8080, symbols: Iterable[str] = (),
+                addr: str = "0.0.0.0") -> TradingMetrics:
     """Get or create global metrics instance"""
     global _metrics
     if _metrics is None:
-        _metrics = TradingMetrics(port=port)
+        _metrics = TradingMetrics(port=port, symbols=symbols, addr=addr)
     return _metrics
 
 
-def init_metrics(port: int = 8080) -> TradingMetrics:
+def init_metrics(port: int = 8080, symbols: Iterable[str] = (),
+                 addr: str = "0.0.0.0") -> TradingMetrics:
     """Initialize and start metrics server"""
-    metrics = get_metrics(port)
+    metrics = get_metrics(port, symbols, addr)
     metrics.start_server()
     return metrics
@@ -4,11 +4,13 @@ Implements position sizing, drawdown limits, and risk controls
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from typing import Dict, Mapping, Optional, Any
+from datetime import date, datetime, timedelta
 from enum import Enum
 import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +23,7 @@ class RiskAction(Enum):
     CLOSE_ALL = "close_all"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskMetrics:
     """Current risk metrics snapshot"""
     total_equity: float
@@ -34,7 +36,22 @@ class RiskMetrics:
     win_rate: float
     consecutive_losses: int
     
+    def to_dict_raw(self) -> Dict[str, Any]:
+        """Numeric values (ratios as fractions) for programmatic consumers"""
+        return {
+            "total_equity": self.total_equity,
+            "unrealized_pnl": self.unrealized_pnl,
+            "realized_pnl_today": self.realized_pnl_today,
+            "daily_drawdown": self.daily_drawdown,
+            "max_drawdown": self.max_drawdown,
+            "open_positions": self.open_positions,
+            "daily_trades": self.daily_trades,
+            "win_rate": self.win_rate,
+            "consecutive_losses": self.consecutive_losses
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
+        """Display form with ratios rendered as percentage strings"""
         return {
             "total_equity": self.total_equity,
             "unrealized_pnl": self.unrealized_pnl,
@@ -48,7 +65,7 @@ class RiskMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Track individual position"""
     symbol: str
@@ -82,19 +99,32 @@ class RiskManager:
         self.config = config.risk
         self.strategy_config = config.strategy
         
-        # State tracking
+        # Limits are fixed once loaded; bind them for the per-trade checks
+        self._max_drawdown = float(self.config.max_drawdown)
+        self._drawdown_warning = self._max_drawdown * 0.7
+        self._max_daily_loss = float(self.config.max_daily_loss)
+        self._max_positions = int(self.config.max_concurrent_trades)
+        self._cooldown_s = float(self.config.cool_down_after_loss)
+        
+        # State tracking. _positions is copy-on-write: writers rebind a new
+        # dict under the lock, so readers can use the current one lock-free.
         self._positions: Dict[str, Position] = {}
         self._daily_pnl: float = 0.0
         self._peak_equity: float = 0.0
         self._current_drawdown: float = 0.0
         self._consecutive_losses: int = 0
-        self._trade_history: List[Dict] = []
-        self._last_loss_time: Optional[datetime] = None
+        self._trade_history: deque = deque(maxlen=100)  # last 100 trades
+        self._history_wins: int = 0  # winning trades currently in _trade_history
+        self._last_loss_monotonic: Optional[float] = None  # starts the loss cooldown
         self._daily_trade_count: int = 0
-        self._last_reset: datetime = datetime.utcnow().date()
+        self._last_reset_day: int = int(time.time() // 86400)  # UTC days since epoch
         
-        # Thread safety
-        self._lock = threading.RLock()
+        # Thread safety (no locked method calls another, so no re-entry).
+        # _lock guards equity, PnL, loss and position state; the trade
+        # history has its own lock so status reads don't contend with
+        # trading. The two are never held together.
+        self._lock = threading.Lock()
+        self._history_lock = threading.Lock()
         
         logger.info(f"RiskManager initialized: "
                    f"MaxDailyLoss={self.config.max_daily_loss*100:.1f}% "
@@ -103,12 +133,12 @@ class RiskManager:
     
     def _reset_daily_metrics(self) -> None:
         """Reset daily metrics at start of new day"""
-        today = datetime.utcnow().date()
-        if today > self._last_reset:
-            logger.info(f"Resetting daily metrics for {today}")
+        today = int(time.time() // 86400)
+        if today > self._last_reset_day:
+            logger.info(f"Resetting daily metrics for {date(1970, 1, 1) + timedelta(days=today)}")
             self._daily_pnl = 0.0
             self._daily_trade_count = 0
-            self._last_reset = today
+            self._last_reset_day = today
     
     def update_equity(self, equity: float) -> None:
         """Update equity and recalculate drawdown"""
@@ -136,40 +166,41 @@ class RiskManager:
             self._reset_daily_metrics()
             
             # Check maximum drawdown
-            if self._current_drawdown >= self.config.max_drawdown:
-                reason = f"Max drawdown exceeded: {self._current_drawdown*100:.2f}% >= {self.config.max_drawdown*100:.1f}%"
+            if self._current_drawdown >= self._max_drawdown:
+                reason = f"Max drawdown exceeded: {self._current_drawdown*100:.2f}% >= {self._max_drawdown*100:.1f}%"
                 logger.warning(f"BLOCK: {reason}")
                 return (RiskAction.CLOSE_ALL, reason)
             
             # Check daily loss limit
-            if self._daily_pnl < 0 and abs(self._daily_pnl / self._peak_equity) >= self.config.max_daily_loss:
+            if self._daily_pnl < 0 and abs(self._daily_pnl / self._peak_equity) >= self._max_daily_loss:
                 reason = f"Daily loss limit reached: {abs(self._daily_pnl):.2f}"
                 logger.warning(f"BLOCK: {reason}")
                 return (RiskAction.BLOCK, reason)
             
             # Check cooldown after losses
-            if self._last_loss_time and self._consecutive_losses >= 3:
-                cooldown_end = self._last_loss_time + timedelta(seconds=self.config.cool_down_after_loss)
-                if datetime.utcnow() < cooldown_end:
-                    remaining = (cooldown_end - datetime.utcnow()).seconds
+            if self._last_loss_monotonic is not None and self._consecutive_losses >= 3:
+                remaining = self._cooldown_s - (time.monotonic() - self._last_loss_monotonic)
+                if remaining > 0:
+                    remaining = int(remaining)
                     reason = f"Cooldown active after {self._consecutive_losses} consecutive losses. {remaining}s remaining"
                     logger.info(f"BLOCK: {reason}")
                     return (RiskAction.BLOCK, reason)
             
             # Check concurrent positions limit
-            if len(self._positions) >= self.config.max_concurrent_trades:
-                reason = f"Max concurrent positions reached: {len(self._positions)}/{self.config.max_concurrent_trades}"
+            positions = self._positions
+            if len(positions) >= self._max_positions:
+                reason = f"Max concurrent positions reached: {len(positions)}/{self._max_positions}"
                 logger.info(f"BLOCK: {reason}")
                 return (RiskAction.BLOCK, reason)
             
             # Check if symbol already has a position
-            if symbol in self._positions:
+            if symbol in positions:
                 reason = f"Position already exists for {symbol}"
                 logger.info(f"BLOCK: {reason}")
                 return (RiskAction.BLOCK, reason)
             
             # Check drawdown warning zone (reduce size)
-            if self._current_drawdown >= self.config.max_drawdown * 0.7:
+            if self._current_drawdown >= self._drawdown_warning:
                 reason = f"Drawdown in warning zone: {self._current_drawdown*100:.2f}%"
                 logger.info(f"REDUCE_SIZE: {reason}")
                 return (RiskAction.REDUCE_SIZE, reason)
@@ -179,7 +210,7 @@ class RiskManager:
     def register_position(self, position: Position) -> None:
         """Register a new position"""
         with self._lock:
-            self._positions[position.symbol] = position
+            self._positions = {**self._positions, position.symbol: position}
             self._daily_trade_count += 1
             logger.info(f"Position registered: {position.symbol} {position.side} "
                        f"@ {position.entry_price:.4f} x {position.size:.6f}")
@@ -192,42 +223,48 @@ class RiskManager:
                 logger.warning(f"Attempted to close non-existent position: {symbol}")
                 return
             
-            position = self._positions.pop(symbol)
+            positions = self._positions.copy()
+            position = positions.pop(symbol)
+            self._positions = positions
             self._daily_pnl += pnl
             
             # Track wins/losses
             if pnl < 0:
                 self._consecutive_losses += 1
-                self._last_loss_time = datetime.utcnow()
+                self._last_loss_monotonic = time.monotonic()
             else:
                 self._consecutive_losses = 0
-            
-            # Store trade history
-            self._trade_history.append({
-                "symbol": symbol,
-                "side": position.side,
-                "entry_price": position.entry_price,
-                "exit_price": exit_price,
-                "size": position.size,
-                "pnl": pnl,
-                "pnl_percent": (pnl / (position.entry_price * position.size)) * 100,
-                "entry_time": position.entry_time.isoformat(),
-                "exit_time": datetime.utcnow().isoformat(),
-                "reason": reason
-            })
-            
-            # Keep last 100 trades
-            if len(self._trade_history) > 100:
-                self._trade_history = self._trade_history[-100:]
-            
-            logger.info(f"Position closed: {symbol} PnL: {pnl:+.2f} "
-                       f"({(pnl / (position.entry_price * position.size)) * 100:+.2f}%)")
+        
+        pnl_percent = (pnl / (position.entry_price * position.size)) * 100
+        trade = {
+            "symbol": symbol,
+            "side": position.side,
+            "entry_price": position.entry_price,
+            "exit_price": exit_price,
+            "size": position.size,
+            "pnl": pnl,
+            "pnl_percent": pnl_percent,
+            "entry_time": position.entry_time,  # ISO-formatted when surfaced
+            "exit_time": datetime.utcnow(),
+            "reason": reason
+        }
+        
+        # Store trade history, keeping the win count in step with eviction
+        with self._history_lock:
+            history = self._trade_history
+            if len(history) == history.maxlen and history[0]["pnl"] > 0:
+                self._history_wins -= 1
+            if pnl > 0:
+                self._history_wins += 1
+            history.append(trade)
+        
+        logger.info(f"Position closed: {symbol} PnL: {pnl:+.2f} ({pnl_percent:+.2f}%)")
     
     def get_adjusted_size(self, base_size: float) -> float:
         """Adjust position size based on current risk state"""
         with self._lock:
             # Reduce size if in drawdown warning zone
-            if self._current_drawdown >= self.config.max_drawdown * 0.7:
+            if self._current_drawdown >= self._drawdown_warning:
                 reduction = 0.5
                 logger.info(f"Reducing position size by {(1-reduction)*100:.0f}% due to drawdown")
                 return base_size * reduction
@@ -241,23 +278,20 @@ class RiskManager:
             
             return base_size
     
-    def get_positions(self) -> Dict[str, Position]:
-        """Get current open positions"""
-        with self._lock:
-            return self._positions.copy()
+    def get_positions(self) -> Mapping[str, Position]:
+        """Get current open positions (a read-only snapshot; no lock taken)"""
+        return self._positions
     
     def get_metrics(self) -> RiskMetrics:
         """Get current risk metrics"""
+        # Win rate over the retained history
+        with self._history_lock:
+            history_len = len(self._trade_history)
+            win_rate = self._history_wins / history_len if history_len else 0.0
+        
         with self._lock:
             self._reset_daily_metrics()
             
-            # Calculate win rate from history
-            if self._trade_history:
-                wins = sum(1 for t in self._trade_history if t["pnl"] > 0)
-                win_rate = wins / len(self._trade_history)
-            else:
-                win_rate = 0.0
-            
             return RiskMetrics(
                 total_equity=self._peak_equity,
                 unrealized_pnl=0.0,  # Calculate with current prices
@@ -270,11 +304,39 @@ class RiskManager:
                 consecutive_losses=self._consecutive_losses
             )
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get full risk manager status"""
+    def get_status(self, formatted: bool = True) -> Dict[str, Any]:
+        """
+        Get full risk manager status
+        
+        Args:
+            formatted: Render ratios as percentage strings for display;
+                pass False for raw numbers and skip the string formatting
+        """
         metrics = self.get_metrics()
+        with self._history_lock:
+            recent_trades = list(self._trade_history)[-5:]
+        recent_trades = [
+            {**t, "entry_time": t["entry_time"].isoformat(), "exit_time": t["exit_time"].isoformat()}
+            for t in recent_trades
+        ]
+        if formatted:
+            metrics_dict = metrics.to_dict()
+            config = {
+                "max_daily_loss": f"{self.config.max_daily_loss*100:.1f}%",
+                "max_drawdown": f"{self.config.max_drawdown*100:.1f}%",
+                "max_positions": self.config.max_concurrent_trades,
+                "cooldown_seconds": self.config.cool_down_after_loss
+            }
+        else:
+            metrics_dict = metrics.to_dict_raw()
+            config = {
+                "max_daily_loss": self.config.max_daily_loss,
+                "max_drawdown": self.config.max_drawdown,
+                "max_positions": self.config.max_concurrent_trades,
+                "cooldown_seconds": self.config.cool_down_after_loss
+            }
         return {
-            "metrics": metrics.to_dict(),
+            "metrics": metrics_dict,
             "positions": {
                 sym: {
                     "side": pos.side,
@@ -285,11 +347,6 @@ class RiskManager:
                 }
                 for sym, pos in self._positions.items()
             },
-            "recent_trades": self._trade_history[-5:],
-            "config": {
-                "max_daily_loss": f"{self.config.max_daily_loss*100:.1f}%",
-                "max_drawdown": f"{self.config.max_drawdown*100:.1f}%",
-                "max_positions": self.config.max_concurrent_trades,
-                "cooldown_seconds": self.config.cool_down_after_loss
-            }
+            "recent_trades": recent_trades,
+            "config": config
         }
@@ -4,12 +4,12 @@ Optimized RSI-based momentum strategy with proper signal generation
 """
 
 import logging
+import math
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any
 from datetime import datetime
-import pandas as pd
-import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,88 @@ class Signal(Enum):
     HOLD = "hold"
 
 
-@dataclass
+class RollingMean:
+    """Fixed-window simple moving average with a running sum"""
+    
+    __slots__ = ("window", "values", "total", "nonzero", "_updates")
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque = deque(maxlen=window)
+        self.total = 0.0
+        self.nonzero = 0  # non-zero values currently in the window
+        self._updates = 0
+    
+    def push(self, value: float) -> None:
+        if len(self.values) == self.window:
+            old = self.values[0]
+            self.total -= old
+            if old != 0:
+                self.nonzero -= 1
+        self.values.append(value)
+        self.total += value
+        if value != 0:
+            self.nonzero += 1
+        
+        # An all-zero window must sum to exactly 0 (RSI treats a zero
+        # average loss specially), whatever residue add/subtract left
+        if self.nonzero == 0:
+            self.total = 0.0
+        
+        # Re-sum once per window so add/subtract rounding can't drift
+        self._updates += 1
+        if self._updates >= self.window:
+            self._updates = 0
+            self.total = math.fsum(self.values)
+    
+    @property
+    def mean(self) -> float:
+        """Window mean; NaN until the window is full"""
+        if len(self.values) < self.window:
+            return float("nan")
+        return self.total / self.window
+
+
+class IndicatorState:
+    """
+    Per-symbol indicator state updated in O(1) per closed candle.
+    
+    RSI uses simple moving averages of gains/losses over rsi_period (the
+    first candle counts as no change, and a zero average loss gives rs = 0),
+    matching the rolling-window formulation the strategy was tuned on.
+    """
+    
+    __slots__ = ("count", "last_close", "gains", "losses", "fast", "slow", "rsi", "rsi_prev")
+    
+    def __init__(self, rsi_period: int, fast_sma: int, slow_sma: int):
+        self.count = 0
+        self.last_close: Optional[float] = None
+        self.gains = RollingMean(rsi_period)
+        self.losses = RollingMean(rsi_period)
+        self.fast = RollingMean(fast_sma)
+        self.slow = RollingMean(slow_sma)
+        self.rsi = float("nan")
+        self.rsi_prev = float("nan")
+    
+    def update(self, close: float) -> None:
+        """Fold one closed candle into the running indicators"""
+        delta = 0.0 if self.last_close is None else close - self.last_close
+        self.last_close = close
+        self.count += 1
+        
+        self.gains.push(delta if delta > 0 else 0.0)
+        self.losses.push(-delta if delta < 0 else 0.0)
+        self.fast.push(close)
+        self.slow.push(close)
+        
+        avg_loss = self.losses.mean
+        rs = self.gains.mean / avg_loss if avg_loss != 0 else 0.0
+        rsi = 100 - (100 / (1 + rs))
+        self.rsi_prev = self.rsi if self.count > 1 else rsi
+        self.rsi = rsi
+
+
+@dataclass(slots=True)
 class TradeSignal:
     """Structured trade signal with metadata"""
     signal: Signal
@@ -70,8 +151,21 @@ class OracleStrategy:
         self.stop_loss = config.strategy.stop_loss
         self.take_profit = config.strategy.take_profit
         
+        # Mirrored short-side thresholds, derived once
+        self._rsi_exit_short = 100 - self.rsi_exit
+        self._rsi_entry_low_short = 100 - self.rsi_entry_low
+        self._rsi_entry_high_short = 100 - self.rsi_entry_high
+        self._entry_range = self.rsi_entry_high - self.rsi_entry_low
+        
+        # Sizing and exit-price multipliers, fixed for the strategy's lifetime
+        self._risk_per_trade = config.strategy.risk_per_trade
+        self._stop_long = 1 - self.stop_loss
+        self._stop_short = 1 + self.stop_loss
+        self._target_long = 1 + self.take_profit
+        self._target_short = 1 - self.take_profit
+        
         # Internal state
-        self._candle_buffer: Dict[str, List[Dict]] = {}
+        self._state: Dict[str, IndicatorState] = {}
         self._indicators: Dict[str, Dict[str, float]] = {}
         
         logger.info(f"Strategy initialized: RSI({self.rsi_period}) "
@@ -79,47 +173,27 @@ class OracleStrategy:
                    f"SL:{self.stop_loss*100:.1f}% TP:{self.take_profit*100:.1f}%")
     
     def update_candle(self, symbol: str, candle: Dict) -> None:
-        """Add new candle to buffer for indicator calculation"""
-        if symbol not in self._candle_buffer:
-            self._candle_buffer[symbol] = []
+        """Fold a closed candle into the symbol's indicator state"""
+        state = self._state.get(symbol)
+        if state is None:
+            state = self._state[symbol] = IndicatorState(
+                self.rsi_period, self.fast_sma, self.slow_sma)
         
-        self._candle_buffer[symbol].append(candle)
+        state.update(float(candle["close"]))
         
-        # Keep last 100 candles for indicator calculation
-        if len(self._candle_buffer[symbol]) > 100:
-            self._candle_buffer[symbol] = self._candle_buffer[symbol][-100:]
-        
-        # Recalculate indicators
-        self._calculate_indicators(symbol)
-    
-    def _calculate_indicators(self, symbol: str) -> None:
-        """Calculate RSI and SMAs from candle buffer"""
-        candles = self._candle_buffer.get(symbol, [])
-        
-        if len(candles) < self.slow_sma:
+        # Publish once the slow SMA has a full window
+        if state.count < self.slow_sma:
             return
         
-        df = pd.DataFrame(candles)
-        closes = df["close"].astype(float)
-        
-        # RSI calculation
-        delta = closes.diff()
-        gain = delta.where(delta > 0, 0).rolling(self.rsi_period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(self.rsi_period).mean()
-        rs = gain / loss.replace(0, np.inf)
-        rsi = 100 - (100 / (1 + rs))
-        
-        # SMA calculation
-        fast_sma = closes.rolling(self.fast_sma).mean()
-        slow_sma = closes.rolling(self.slow_sma).mean()
-        
+        fast_sma = state.fast.mean
+        slow_sma = state.slow.mean
         self._indicators[symbol] = {
-            "rsi": rsi.iloc[-1],
-            "rsi_prev": rsi.iloc[-2] if len(rsi) > 1 else rsi.iloc[-1],
-            "fast_sma": fast_sma.iloc[-1],
-            "slow_sma": slow_sma.iloc[-1],
-            "price": closes.iloc[-1],
-            "trend": "bullish" if fast_sma.iloc[-1] > slow_sma.iloc[-1] else "bearish"
+            "rsi": state.rsi,
+            "rsi_prev": state.rsi_prev,
+            "fast_sma": fast_sma,
+            "slow_sma": slow_sma,
+            "price": state.last_close,
+            "trend": "bullish" if fast_sma > slow_sma else "bearish"
         }
     
     def generate_signal(self, symbol: str, current_position: Optional[str] = None) -> TradeSignal:
@@ -164,10 +238,10 @@ class OracleStrategy:
                 reason = f"RSI overbought exit: {rsi:.1f} >= {self.rsi_exit}"
         
         elif current_position == "short":
-            if rsi <= (100 - self.rsi_exit):
+            if rsi <= self._rsi_exit_short:
                 signal = Signal.EXIT_SHORT
-                confidence = min(1.0, ((100 - self.rsi_exit) - rsi) / 10)
-                reason = f"RSI oversold exit: {rsi:.1f} <= {100 - self.rsi_exit}"
+                confidence = min(1.0, (self._rsi_exit_short - rsi) / 10)
+                reason = f"RSI oversold exit: {rsi:.1f} <= {self._rsi_exit_short}"
         
         # Entry conditions (only if no position)
         elif current_position is None:
@@ -175,16 +249,14 @@ class OracleStrategy:
             if (rsi_prev < self.rsi_entry_low <= rsi <= self.rsi_entry_high 
                 and trend == "bullish"):
                 signal = Signal.LONG
-                confidence = min(1.0, (self.rsi_entry_high - rsi) / 
-                               (self.rsi_entry_high - self.rsi_entry_low))
+                confidence = min(1.0, (self.rsi_entry_high - rsi) / self._entry_range)
                 reason = f"RSI bullish crossup: {rsi_prev:.1f} -> {rsi:.1f}, trend: {trend}"
             
             # Short entry: RSI crossing down from overbought
-            elif (rsi_prev > (100 - self.rsi_entry_low) >= rsi >= (100 - self.rsi_entry_high)
+            elif (rsi_prev > self._rsi_entry_low_short >= rsi >= self._rsi_entry_high_short
                   and trend == "bearish"):
                 signal = Signal.SHORT
-                confidence = min(1.0, (rsi - (100 - self.rsi_entry_high)) / 
-                               (self.rsi_entry_high - self.rsi_entry_low))
+                confidence = min(1.0, (rsi - self._rsi_entry_high_short) / self._entry_range)
                 reason = f"RSI bearish crossdown: {rsi_prev:.1f} -> {rsi:.1f}, trend: {trend}"
         
         return TradeSignal(
@@ -204,7 +276,7 @@ class OracleStrategy:
         Uses fixed fractional position sizing:
         Position = (Balance * Risk%) / Stop Loss %
         """
-        risk_amount = balance * self.config.strategy.risk_per_trade
+        risk_amount = balance * self._risk_per_trade
         position_size = risk_amount / (entry_price * self.stop_loss)
         
         # Apply maximum position limit
@@ -213,17 +285,11 @@ class OracleStrategy:
     
     def get_stop_loss_price(self, entry_price: float, side: str) -> float:
         """Calculate stop loss price for a position"""
-        if side == "long":
-            return entry_price * (1 - self.stop_loss)
-        else:  # short
-            return entry_price * (1 + self.stop_loss)
+        return entry_price * (self._stop_long if side == "long" else self._stop_short)
     
     def get_take_profit_price(self, entry_price: float, side: str) -> float:
         """Calculate take profit price for a position"""
-        if side == "long":
-            return entry_price * (1 + self.take_profit)
-        else:  # short
-            return entry_price * (1 - self.take_profit)
+        return entry_price * (self._target_long if side == "long" else self._target_short)
     
     def get_indicators(self, symbol: str) -> Dict[str, float]:
         """Get current indicators for a symbol"""
@@ -0,0 +1,99 @@
+"""Candle close detection in CandleFeed._on_message"""
+
+import logging
+
+import orjson
+import pytest
+
+from src.market_data import CandleFeed
+
+MINUTE_US = 60_000_000
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(orjson.loads(data))
+
+
+def candle(start, close, symbol="BTCUSD", channel="candlestick_1m"):
+    return orjson.dumps({
+        "type": channel,
+        "symbol": symbol,
+        "candle_start_time": start,
+        "close": close,
+    })
+
+
+@pytest.fixture
+def feed():
+    closed = []
+    f = CandleFeed("wss://example.invalid", ["BTCUSD", "ETHUSD"],
+                   lambda symbol, c: closed.append((symbol, c["close"])))
+    f.closed = closed
+    return f
+
+
+def test_candle_reported_when_newer_start_arrives(feed):
+    feed._on_message(None, candle(0, 100))
+    feed._on_message(None, candle(0, 101))
+    assert feed.closed == []
+
+    feed._on_message(None, candle(MINUTE_US, 102))
+    assert feed.closed == [("BTCUSD", 101)]
+
+
+def test_late_update_for_superseded_candle_is_ignored(feed):
+    feed._on_message(None, candle(MINUTE_US, 100))
+    feed._on_message(None, candle(0, 99))
+    feed._on_message(None, candle(2 * MINUTE_US, 101))
+    assert feed.closed == [("BTCUSD", 100)]
+
+
+def test_symbols_are_tracked_independently(feed):
+    feed._on_message(None, candle(0, 100, "BTCUSD"))
+    feed._on_message(None, candle(0, 10, "ETHUSD"))
+    feed._on_message(None, candle(MINUTE_US, 11, "ETHUSD"))
+    assert feed.closed == [("ETHUSD", 10)]
+
+
+@pytest.mark.parametrize("message", [
+    orjson.dumps({"type": "subscriptions", "channels": []}),
+    candle(MINUTE_US, 1, channel="candlestick_5m"),
+    orjson.dumps({"type": "candlestick_1m", "symbol": "BTCUSD"}),
+    orjson.dumps([1, 2, 3]),
+    b"{not json",
+])
+def test_non_candle_and_malformed_messages_are_dropped(feed, message):
+    feed._on_message(None, candle(0, 100))
+    feed._on_message(None, message)
+    assert feed.closed == []
+    assert feed._open["BTCUSD"]["close"] == 100
+
+
+def test_reconnect_discards_candle_left_open(feed):
+    ws = FakeSocket()
+    feed._on_open(ws)
+    feed._on_message(None, candle(0, 100))
+
+    feed._on_open(ws)
+    feed._on_message(None, candle(MINUTE_US, 101))
+    assert feed.closed == []
+    assert ws.sent[-1]["type"] == "subscribe"
+
+    feed._on_message(None, candle(2 * MINUTE_US, 102))
+    assert feed.closed == [("BTCUSD", 101)]
+
+
+def test_gap_is_logged(feed, caplog):
+    feed._on_message(None, candle(0, 100))
+    feed._on_message(None, candle(MINUTE_US, 101))
+    with caplog.at_level(logging.WARNING, logger="src.market_data"):
+        feed._on_message(None, candle(4 * MINUTE_US, 102))
+        feed._on_message(None, candle(5 * MINUTE_US, 103))
+    assert feed.closed == [("BTCUSD", 100), ("BTCUSD", 101), ("BTCUSD", 102)]
+    assert [r.getMessage() for r in caplog.records] == [
+        "Candle feed gap on BTCUSD: 2 bar(s) missed",
+    ]
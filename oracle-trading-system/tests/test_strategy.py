@@ -0,0 +1,109 @@
+"""IndicatorState parity with the full-window rolling-mean indicators"""
+
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src.strategy import IndicatorState, OracleStrategy
+
+RSI_PERIOD, FAST, SLOW = 14, 20, 50
+
+
+def closes():
+    """Random walk with a flat stretch and a monotonic run-up"""
+    rng = random.Random(7)
+    price = 30000.0
+    out = []
+    for _ in range(300):
+        price = round(price * (1 + rng.gauss(0, 0.004)), 1)
+        out.append(price)
+    out.extend([price] * 20)
+    out.extend(price + 5.0 * i for i in range(1, 31))
+    for _ in range(150):
+        price = round(out[-1] * (1 + rng.gauss(0, 0.004)), 1)
+        out.append(price)
+    return out
+
+
+def reference(series, i):
+    """Indicators at index i, recomputed from scratch over the window"""
+    deltas = [0.0] + [b - a for a, b in zip(series, series[1:])]
+
+    def rsi_at(j):
+        window = deltas[j - RSI_PERIOD + 1:j + 1]
+        gain = sum(d for d in window if d > 0) / RSI_PERIOD
+        loss = sum(-d for d in window if d < 0) / RSI_PERIOD
+        rs = gain / loss if loss else 0.0
+        return 100 - 100 / (1 + rs)
+
+    return {
+        "rsi": rsi_at(i),
+        "rsi_prev": rsi_at(i - 1),
+        "fast_sma": sum(series[i - FAST + 1:i + 1]) / FAST,
+        "slow_sma": sum(series[i - SLOW + 1:i + 1]) / SLOW,
+    }
+
+
+def test_indicator_state_matches_full_recompute():
+    series = closes()
+    state = IndicatorState(RSI_PERIOD, FAST, SLOW)
+    for i, close in enumerate(series):
+        state.update(close)
+        if i < SLOW - 1:
+            continue
+        expected = reference(series, i)
+        assert state.rsi == pytest.approx(expected["rsi"], abs=1e-9)
+        assert state.rsi_prev == pytest.approx(expected["rsi_prev"], abs=1e-9)
+        assert state.fast.mean == pytest.approx(expected["fast_sma"], abs=1e-9)
+        assert state.slow.mean == pytest.approx(expected["slow_sma"], abs=1e-9)
+
+
+def test_zero_average_loss_gives_zero_rsi():
+    state = IndicatorState(RSI_PERIOD, FAST, SLOW)
+    for i in range(RSI_PERIOD + 1):
+        state.update(100.0 + i)
+    assert state.rsi == 0.0
+
+
+def test_zero_rsi_after_losses_roll_out_of_the_window():
+    # Losses from closes spanning several float binades don't sum exactly,
+    # so subtracting them back out of the running total leaves residue;
+    # once only gains remain the average loss must still be exactly zero
+    state = IndicatorState(RSI_PERIOD, FAST, SLOW)
+    for close in [2.68, 1.44, 0.84] + [0.84 + k for k in range(1, RSI_PERIOD + 1)]:
+        state.update(close)
+    assert state.losses.mean == 0.0
+    assert state.rsi == 0.0
+
+
+def test_means_are_nan_until_window_full():
+    state = IndicatorState(RSI_PERIOD, FAST, SLOW)
+    for i in range(FAST - 1):
+        state.update(100.0 + i)
+    assert math.isnan(state.fast.mean)
+    state.update(200.0)
+    assert not math.isnan(state.fast.mean)
+    assert math.isnan(state.slow.mean)
+
+
+def test_strategy_publishes_once_slow_window_is_full():
+    config = SimpleNamespace(strategy=SimpleNamespace(
+        rsi_period=RSI_PERIOD, rsi_entry_low=30, rsi_entry_high=60, rsi_exit=80,
+        fast_sma=FAST, slow_sma=SLOW, stop_loss=0.07, take_profit=0.21,
+        risk_per_trade=0.05,
+    ))
+    strategy = OracleStrategy(config)
+    series = closes()
+    for close in series[:SLOW]:
+        assert strategy.get_indicators("BTCUSD") == {}
+        strategy.update_candle("BTCUSD", {"close": close})
+
+    indicators = strategy.get_indicators("BTCUSD")
+    expected = reference(series, SLOW - 1)
+    assert indicators["price"] == series[SLOW - 1]
+    for key, value in expected.items():
+        assert indicators[key] == pytest.approx(value, abs=1e-9)
+    assert indicators["trend"] == (
+        "bullish" if expected["fast_sma"] > expected["slow_sma"] else "bearish")